@@ -20,7 +20,6 @@ extensions = [
     "sphinxcontrib.jquery",
     "sphinx.ext.intersphinx",
     "sphinx.ext.napoleon",
-    "sphinx.ext.todo",
 ]
 
 autodoc_mock_imports = ["digitalio", "busio", "micropython"]
@@ -31,7 +30,6 @@ autodoc_preserve_defaults = True
 intersphinx_mapping = {
     "python": ("https://docs.python.org/3", None),
     "BusDevice": ("https://docs.circuitpython.org/projects/busdevice/en/latest/", None),
-    "Register": ("https://docs.circuitpython.org/projects/register/en/latest/", None),
     "CircuitPython": ("https://docs.circuitpython.org/en/latest/", None),
 }
 
@@ -97,12 +95,6 @@ add_function_parentheses = True
 # The name of the Pygments (syntax highlighting) style to use.
 pygments_style = "sphinx"
 
-# If true, `todo` and `todoList` produce output, else they produce nothing.
-todo_include_todos = False
-
-# If this is True, todo emits a warning for each TODO entries. The default is False.
-todo_emit_warnings = True
-
 napoleon_numpy_docstring = False
 
 # -- Options for HTML output ----------------------------------------------
@@ -14,4 +14,7 @@ while True:
     for i, touch in enumerate(gt.touches):
         x, y, a = touch
         print(f"[{i+1}]({x},{y}) size:{a}")
-    time.sleep(1)
+    # The GT911 reports new coordinates roughly every 10ms, polling faster only
+    # returns the same data. If the INT pin is wired and the device is configured for
+    # level-triggered interrupts, pass int_pin and int_active to skip idle polls.
+    time.sleep(0.01)
@@ -23,15 +23,17 @@ Implementation Notes
 * Adafruit CircuitPython firmware for the supported boards:
   https://circuitpython.org/downloads
 * Adafruit's Bus Device library: https://github.com/adafruit/Adafruit_CircuitPython_BusDevice
-* Adafruit's Register library: https://github.com/adafruit/Adafruit_CircuitPython_Register
 """
+import array
 import struct
 import time
+from collections import namedtuple
 import digitalio
 from micropython import const
 from adafruit_bus_device.i2c_device import I2CDevice
 
 try:
+    from typing import Iterator
     from busio import I2C
     from circuitpython_typing import ReadableBuffer
 except ImportError:
@@ -40,15 +42,27 @@ except ImportError:
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/rgrizzell/CircuitPython_GT911.git"
 
-_GT_DEFAULT_I2C_ADDR = 0x5D
-_GT_SECONDARY_I2C_ADDR = 0x14
+_GT_DEFAULT_I2C_ADDR = const(0x5D)
+_GT_SECONDARY_I2C_ADDR = const(0x14)
 
 _GT_COMMAND = const(0x8040)
 _GT_POINT_STATUS = const(0x814E)
 _GT_POINT_START = const(0x814F)
 
+Touch = namedtuple("Touch", ("x", "y", "size"))
+"""A single touch point, as returned by `GT911.touches`."""
 
-class GT911:
+# Touch point layout: X, Y and size as unsigned little-endian 16-bit values.
+_POINT_FORMAT = "<HHH"
+
+# Big-endian register addresses, packed once at import.
+_ADDR = {reg: struct.pack(">H", reg) for reg in (_GT_COMMAND, _GT_POINT_STATUS)}
+
+# Clears the buffer status once the touch points have been read.
+_ACK = _ADDR[_GT_POINT_STATUS] + b"\x00"
+
+
+class GT911:  # pylint: disable=too-many-instance-attributes
     """A driver for the GT911 capacitive touch sensor.
 
     :param i2c: The object representing the I2C interface used to communicate with the touchscreen.
@@ -60,6 +74,18 @@ class GT911:
     :type rst_pin: DigitalInOut
     :param int_pin: The object representing the INTERRUPT/IRQ pin.
     :type int_pin: DigitalInOut
+    :param int_high: Level the INTERRUPT pin is held at during reset, which selects the
+        I2C address.
+    :type int_high: bool
+    :param int_active: Level of the INTERRUPT pin while touch data is pending. When set,
+        `touches` skips the I2C transaction whenever the pin is at the other level. Only
+        use this when the device is configured for level-triggered interrupts.
+    :type int_active: bool
+    :param poll_interval: Minimum time between reads of the device, in seconds. Calls
+        within this interval return the touches from the previous read again instead of
+        reading the device. Defaults to 0, which reads the device on every call.
+        Requires ``time.monotonic_ns()`` when set.
+    :type poll_interval: float
     """
 
     # pylint: disable=too-many-arguments
@@ -70,11 +96,22 @@ class GT911:
         rst_pin: digitalio.DigitalInOut = None,
         int_pin: digitalio.DigitalInOut = None,
         int_high: bool = False,
+        int_active: bool = None,
+        poll_interval: float = 0,
     ):
         self.rst_pin = rst_pin
         self.int_pin = int_pin
         self.int_high = int_high
-        self._touch_data = [tuple()] * 5
+        self.int_active = int_active
+        self._poll_interval_ns = int(poll_interval * 1_000_000_000)
+        self._last_poll_ns = 0
+        # Touch data is stored as separate X, Y and size arrays, filled in place.
+        self._x = array.array("H", [0] * 5)
+        self._y = array.array("H", [0] * 5)
+        self._sz = array.array("H", [0] * 5)
+        self._n = 0
+        # Shared read buffer for the status byte and five point slots, reused each poll.
+        self._buf = bytearray(1 + 5 * 8)
 
         # Reset and Interrupt pins are optional, but together they can be used to
         # reset the device into a different I2C configuration.
@@ -94,25 +131,116 @@ class GT911:
         self._write(_GT_COMMAND, [0])  # Set mode: Read coordinates
 
     @property
-    def touches(self) -> list[tuple]:
-        """Get the touches from the device.
+    def touches(self) -> list[Touch]:
+        """Get the touches from the device. When ``poll_interval`` is set, calls within
+        that interval return the previous touches again.
 
         :return: List of touch points containing coordinates and size.
-        :rtype: list[tuple]
+        :rtype: list[Touch]
+        """
+        return list(self.iter_touches())
+
+    def iter_touches(self) -> Iterator[Touch]:
+        """Get the touches from the device, one at a time. Unlike `touches`, no list is
+        built, which keeps allocations down in tight polling loops.
+
+        :return: Iterator of touch points containing coordinates and size.
+        :rtype: Iterator[Touch]
+        """
+        for i in range(self._poll()):
+            yield Touch(self._x[i], self._y[i], self._sz[i])
+
+    async def wait_for_touches(self, interval: float = 0.01) -> list[Touch]:
+        """Wait until the device reports touches, sleeping between polls so other tasks
+        can run. Requires the asyncio library.
+
+        :param interval: Time to sleep between polls, in seconds.
+        :type interval: float
+        :return: List of touch points containing coordinates and size.
+        :rtype: list[Touch]
+        """
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        while True:
+            touches = self.touches
+            if touches:
+                return touches
+            await asyncio.sleep(interval)
+
+    @property
+    def x(self) -> memoryview:
+        """X coordinates of the touch points read by the last poll of the device.
+
+        :return: View of the X coordinates, without copying.
+        :rtype: memoryview
+        """
+        return memoryview(self._x)[: self._n]
+
+    @property
+    def y(self) -> memoryview:
+        """Y coordinates of the touch points read by the last poll of the device.
+
+        :return: View of the Y coordinates, without copying.
+        :rtype: memoryview
+        """
+        return memoryview(self._y)[: self._n]
+
+    @property
+    def size(self) -> memoryview:
+        """Sizes of the touch points read by the last poll of the device.
+
+        :return: View of the touch sizes, without copying.
+        :rtype: memoryview
         """
-        num_touch_points = 0
-        touch_status = self._read(_GT_POINT_STATUS, 1)[0]
-        if touch_status & 0x80:  # if bit7 == 1
-            num_touch_points = touch_status & 0x0F  # get bit0
-            for i in range(0, num_touch_points):
-                # Read the touch point, 8 bytes in total.
-                data = self._read(_GT_POINT_START + i * 8, 8)
-                # Unpack the touch data.
-                self._touch_data[i] = struct.unpack("hhh", data[1:7])
-        # Reset the buffer for the next series of touches.
-        self._write(_GT_POINT_STATUS, [0])
-
-        return self._touch_data[0:num_touch_points]
+        return memoryview(self._sz)[: self._n]
+
+    def _poll(self) -> int:
+        """Read the touch points from the device into the touch data arrays.
+
+        :return: Number of touch points read.
+        :rtype: int
+        """
+        if self._poll_interval_ns:
+            now = time.monotonic_ns()
+            if now - self._last_poll_ns < self._poll_interval_ns:
+                # Too soon for new data, reuse the previous read.
+                return self._n
+            self._last_poll_ns = now
+
+        self._n = 0
+        if (
+            self.int_pin
+            and self.int_active is not None
+            and self.int_pin.value != self.int_active
+        ):
+            # No new data pending, avoid polling the bus.
+            return 0
+
+        # Hold the bus once for both the read and the acknowledge.
+        with self.i2c_device as i2c:
+            # The status register directly precedes the touch points, so read the
+            # status and all five 8-byte point slots in one transaction.
+            data = self._read_locked(i2c, _GT_POINT_STATUS, 1 + 5 * 8)
+            touch_status = data[0]
+            if not touch_status & 0x80:  # if bit7 == 0
+                # The buffer holds no new data, so there is nothing to acknowledge.
+                return 0
+
+            # The low nibble holds the number of points, the device buffers at most 5.
+            self._n = min(touch_status & 0x0F, 5)
+            # Local aliases avoid repeated global and attribute lookups in the loop.
+            unpack_from = struct.unpack_from
+            x_vals, y_vals, sizes = self._x, self._y, self._sz
+            for i in range(self._n):
+                offset = _GT_POINT_START - _GT_POINT_STATUS + i * 8
+                # Unpack the touch data, skipping the track ID.
+                x_vals[i], y_vals[i], sizes[i] = unpack_from(
+                    _POINT_FORMAT, data, offset + 1
+                )
+            # Reset the buffer for the next series of touches.
+            i2c.write(_ACK)
+
+        return self._n
 
     def _reset(self) -> None:
         """If the reset pin is defined, the device can be reset. If the interrupt pin is also
@@ -121,12 +249,7 @@ class GT911:
         if not self.rst_pin:
             raise RuntimeError("RESET pin must be configured to reset device.")
 
-        self.rst_pin.switch_to_output(True)  # Switch pin to output, high
-        if self.int_pin:
-            self.rst_pin.switch_to_output(False)  # Switch pin to output, low
-            time.sleep(0.005)  # Wait >5ms
-
-        self.rst_pin.value = False  # Stop the device
+        self.rst_pin.switch_to_output(False)  # Stop the device
         time.sleep(0.01)  # Wait >10ms
 
         # Interrupt pin modifies I2C addressing (High: 0x14 | Low: 0x5D)
@@ -142,18 +265,24 @@ class GT911:
             time.sleep(0.005)  # Wait >5ms
             self.int_pin.switch_to_input()  # Listen for interrupts
 
-    def _read(self, register: int, length: int) -> bytearray:
-        payload = bytes([register >> 8, register & 0xFF])
-        result = bytearray(length)
-        with self.i2c_device as i2c:
-            i2c.write_then_readinto(payload, result)
+    def _read_locked(self, i2c: I2CDevice, register: int, length: int) -> memoryview:
+        """Read from a register into the shared read buffer, on a device the caller has
+        already locked. The returned view is only valid until the next read.
+        """
+        payload = _ADDR.get(register) or struct.pack(">H", register)
+        i2c.write_then_readinto(payload, self._buf, in_end=length)
 
-        return result
+        return memoryview(self._buf)[:length]
 
     def _write(self, register: int, values: ReadableBuffer) -> None:
-        payload = bytearray([register >> 8, register & 0xFF])
-        payload[2:] = bytes(
-            [(v & 0xFF) for v in values]
-        )  # Ensure each value does not exceed 1 byte.
         with self.i2c_device as i2c:
-            i2c.write(bytes(payload))
+            self._write_locked(i2c, register, values)
+
+    @staticmethod
+    def _write_locked(i2c: I2CDevice, register: int, values: ReadableBuffer) -> None:
+        """Like `_write`, but on a device the caller has already locked."""
+        payload = bytearray(2 + len(values))
+        payload[0:2] = _ADDR.get(register) or struct.pack(">H", register)
+        for i, value in enumerate(values):
+            payload[2 + i] = value & 0xFF  # Ensure each value does not exceed 1 byte.
+        i2c.write(payload)